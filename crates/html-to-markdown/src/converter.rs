@@ -1237,20 +1237,9 @@ fn record_node_hierarchy(node_handle: tl::NodeHandle, parent: Option<u32>, parse
 
 fn may_be_hocr(input: &str) -> bool {
     let bytes = input.as_bytes();
-    if bytes.len() < 4 {
-        return false;
-    }
-    let mut idx = 0;
-    while idx + 3 < bytes.len() {
-        if bytes[idx] == b'o' && bytes[idx + 1] == b'c' && bytes[idx + 2] == b'r' {
-            match bytes[idx + 3] {
-                b'_' | b'-' | b'x' => return true,
-                _ => {}
-            }
-        }
-        idx += 1;
-    }
-    false
+    input
+        .match_indices("ocr")
+        .any(|(idx, _)| matches!(bytes.get(idx + 3), Some(b'_' | b'-' | b'x')))
 }
 
 /// Check if a document is an hOCR (HTML-based OCR) document.
@@ -1495,12 +1484,34 @@ fn is_empty_inline_element(node_handle: &tl::NodeHandle, parser: &tl::Parser, do
 
     if let Some(tag_name) = tag_name {
         if EMPTY_WHEN_NO_CONTENT_TAGS.contains(&tag_name.as_ref()) {
-            return get_text_content(node_handle, parser, dom_ctx).trim().is_empty();
+            return !has_non_whitespace_text(node_handle, parser);
         }
     }
     false
 }
 
+/// Check whether any descendant text of a node contains a non-whitespace character.
+///
+/// Equivalent to `!get_text_content(..).trim().is_empty()`, but stops at the first
+/// visible character instead of materializing the whole subtree's text.
+#[allow(clippy::trivially_copy_pass_by_ref)]
+fn has_non_whitespace_text(node_handle: &tl::NodeHandle, parser: &tl::Parser) -> bool {
+    match node_handle.get(parser) {
+        Some(tl::Node::Raw(bytes)) => {
+            let raw = bytes.as_utf8_str();
+            !text::decode_html_entities_cow(raw.as_ref()).trim().is_empty()
+        }
+        Some(tl::Node::Tag(tag)) => {
+            let children = tag.children();
+            children
+                .top()
+                .iter()
+                .any(|child_handle| has_non_whitespace_text(child_handle, parser))
+        }
+        _ => false,
+    }
+}
+
 /// Get the text content of a node and its children.
 #[allow(clippy::trivially_copy_pass_by_ref)]
 fn get_text_content(node_handle: &tl::NodeHandle, parser: &tl::Parser, dom_ctx: &DomContext) -> String {
@@ -2922,18 +2933,10 @@ fn attribute_contains_any(tag: &tl::HTMLTag, attr: &str, keywords: &[&str]) -> b
     keywords.iter().any(|kw| lower.contains(*kw))
 }
 
-/// Serialize a tag and its children back to HTML.
+/// Recursively serialize a node back to HTML, appending to `output`.
 ///
 /// This is used for the `preserve_tags` feature to output original HTML for specific elements.
 #[allow(clippy::trivially_copy_pass_by_ref)]
-fn serialize_tag_to_html(handle: &tl::NodeHandle, parser: &tl::Parser) -> String {
-    let mut html = String::new();
-    serialize_node_to_html(handle, parser, &mut html);
-    html
-}
-
-/// Recursively serialize a node to HTML.
-#[allow(clippy::trivially_copy_pass_by_ref)]
 fn serialize_node_to_html(handle: &tl::NodeHandle, parser: &tl::Parser, output: &mut String) {
     match handle.get(parser) {
         Some(tl::Node::Tag(tag)) => {
@@ -3651,8 +3654,7 @@ fn walk_node(
             }
 
             if ctx.preserve_tags.contains(tag_name.as_ref()) {
-                let html = serialize_tag_to_html(node_handle, parser);
-                output.push_str(&html);
+                serialize_node_to_html(node_handle, parser, output);
                 return;
             }
 
@@ -7659,7 +7661,7 @@ fn walk_node(
                                                 let json = child_tag.inner_text(parser);
                                                 let json = json.trim();
                                                 if !json.is_empty() {
-                                                    let json = text::decode_html_entities(json).clone();
+                                                    let json = text::decode_html_entities(json);
                                                     if !json.is_empty() {
                                                         collector.borrow_mut().add_json_ld(json);
                                                     }
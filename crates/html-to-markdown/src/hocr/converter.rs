@@ -923,11 +923,11 @@ fn extract_code_lines(paragraph: &HocrElement) -> Vec<CodeLineInfo> {
     lines
 }
 
-fn collect_line_words(element: &HocrElement, words: &mut Vec<String>) {
+fn collect_line_words<'a>(element: &'a HocrElement, words: &mut Vec<&'a str>) {
     if element.element_type == HocrElementType::OcrxWord {
         let trimmed = element.text.trim();
         if !trimmed.is_empty() {
-            words.push(trimmed.to_string());
+            words.push(trimmed);
         }
     }
 
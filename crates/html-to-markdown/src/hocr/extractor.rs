@@ -166,10 +166,17 @@ fn extract_element(node_handle: &tl::NodeHandle, parser: &tl::Parser) -> Option<
             }
         }
 
+        let trimmed = text.trim();
+        let text = if trimmed.len() == text.len() {
+            text
+        } else {
+            trimmed.to_string()
+        };
+
         Some(HocrElement {
             element_type,
             properties,
-            text: text.trim().to_string(),
+            text,
             children,
         })
     } else {
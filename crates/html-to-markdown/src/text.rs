@@ -1,23 +1,14 @@
 #![allow(clippy::cast_precision_loss, clippy::cast_sign_loss, clippy::unused_self)]
 //! Text processing utilities for Markdown conversion.
 
-use regex::Regex;
 use std::borrow::Cow;
-use std::sync::LazyLock;
-
-/// Regex for escaping miscellaneous characters
-static ESCAPE_MISC_RE: LazyLock<Regex> = LazyLock::new(|| Regex::new(r"([\\&<`\[\]>~#=+|\-])").unwrap());
-
-/// Regex for escaping numbered lists
-static ESCAPE_NUMBERED_LIST_RE: LazyLock<Regex> = LazyLock::new(|| Regex::new(r"([0-9])([.)])").unwrap());
-
-/// Regex for escaping ASCII punctuation (CommonMark spec example 12)
-/// Matches: `! " # $ % & ' ( ) * + , - . / : ; < = > ? @ [ \ ] ^ _ \` { | } ~`
-static ESCAPE_ASCII_RE: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"([!\x22#$%&\x27()*+,\-./:;<=>?@\[\\\]^_`{|}~])").unwrap());
 
 /// Escape Markdown special characters in text.
 ///
+/// All enabled escapes are applied in a single pass over the bytes. With `escape_misc`,
+/// a `.` or `)` directly after an ASCII digit is escaped too so it cannot start an
+/// ordered list item.
+///
 /// # Arguments
 ///
 /// * `text` - Text to escape
@@ -45,81 +36,40 @@ pub fn escape(
         return text.to_string();
     }
 
-    if escape_ascii
-        && !text.as_bytes().iter().any(|b| {
-            matches!(
-                b,
-                b'!' | b'"'
-                    | b'#'
-                    | b'$'
-                    | b'%'
-                    | b'&'
-                    | b'\''
-                    | b'('
-                    | b')'
-                    | b'*'
-                    | b'+'
-                    | b','
-                    | b'-'
-                    | b'.'
-                    | b'/'
-                    | b':'
-                    | b';'
-                    | b'<'
-                    | b'='
-                    | b'>'
-                    | b'?'
-                    | b'@'
-                    | b'['
-                    | b'\\'
-                    | b']'
-                    | b'^'
-                    | b'_'
-                    | b'`'
-                    | b'{'
-                    | b'|'
-                    | b'}'
-                    | b'~'
-            )
-        })
-    {
-        return text.to_string();
-    }
-
-    if !escape_ascii && escape_misc && !escape_asterisks && !escape_underscores {
-        let needs_misc = text.as_bytes().iter().any(|b| {
-            matches!(
-                b,
-                b'\\' | b'&' | b'<' | b'`' | b'[' | b']' | b'>' | b'~' | b'#' | b'=' | b'+' | b'|' | b'-'
-            )
-        });
-        let needs_numbered = text.as_bytes().iter().any(|b| matches!(b, b'.' | b')'));
-        if !needs_misc && !needs_numbered {
-            return text.to_string();
+    let bytes = text.as_bytes();
+    let needs_escape = |idx: usize| {
+        let byte = bytes[idx];
+        if escape_ascii {
+            byte.is_ascii_punctuation()
+        } else {
+            match byte {
+                b'*' => escape_asterisks,
+                b'_' => escape_underscores,
+                b'\\' | b'&' | b'<' | b'`' | b'[' | b']' | b'>' | b'~' | b'#' | b'=' | b'+' | b'|' | b'-' => {
+                    escape_misc
+                }
+                b'.' | b')' => escape_misc && idx > 0 && bytes[idx - 1].is_ascii_digit(),
+                _ => false,
+            }
         }
-    }
-
-    let mut result = text.to_string();
-
-    if escape_ascii {
-        result = ESCAPE_ASCII_RE.replace_all(&result, r"\$1").to_string();
-        return result;
-    }
-
-    if escape_misc {
-        result = ESCAPE_MISC_RE.replace_all(&result, r"\$1").to_string();
+    };
 
-        result = ESCAPE_NUMBERED_LIST_RE.replace_all(&result, r"$1\$2").to_string();
-    }
+    let Some(first) = (0..bytes.len()).find(|&idx| needs_escape(idx)) else {
+        return text.to_string();
+    };
 
-    if escape_asterisks {
-        result = result.replace('*', r"\*");
-    }
+    let mut result = String::with_capacity(text.len() + text.len() / 8);
+    let mut last = 0;
 
-    if escape_underscores {
-        result = result.replace('_', r"\_");
+    for idx in first..bytes.len() {
+        if needs_escape(idx) {
+            result.push_str(&text[last..idx]);
+            result.push('\\');
+            last = idx;
+        }
     }
 
+    result.push_str(&text[last..]);
     result
 }
 
@@ -175,8 +125,14 @@ pub fn chomp(text: &str) -> (&str, &str, &str) {
 #[must_use]
 pub fn normalize_whitespace(text: &str) -> String {
     let mut result = String::with_capacity(text.len());
-    let mut prev_was_space = false;
+    push_normalized_whitespace(&mut result, text, false);
+    result
+}
 
+/// Append `text` to `result`, collapsing runs of spaces, tabs and Unicode spaces.
+///
+/// `prev_was_space` tells whether `result` already ends with a collapsed space.
+fn push_normalized_whitespace(result: &mut String, text: &str, mut prev_was_space: bool) {
     for ch in text.chars() {
         let is_space = ch == ' ' || ch == '\t' || is_unicode_space(ch);
 
@@ -190,8 +146,6 @@ pub fn normalize_whitespace(text: &str) -> String {
             prev_was_space = false;
         }
     }
-
-    result
 }
 
 /// Normalize whitespace in text, returning borrowed or owned result as needed.
@@ -213,11 +167,14 @@ pub fn normalize_whitespace(text: &str) -> String {
 pub fn normalize_whitespace_cow(text: &str) -> Cow<'_, str> {
     let mut prev_was_space = false;
 
-    for ch in text.chars() {
+    for (idx, ch) in text.char_indices() {
         let is_space = ch == ' ' || ch == '\t' || is_unicode_space(ch);
         if is_space {
             if prev_was_space || ch != ' ' {
-                return Cow::Owned(normalize_whitespace(text));
+                let mut result = String::with_capacity(text.len());
+                result.push_str(&text[..idx]);
+                push_normalized_whitespace(&mut result, &text[idx..], prev_was_space);
+                return Cow::Owned(result);
             }
             prev_was_space = true;
         } else {
@@ -246,7 +203,7 @@ pub fn normalize_whitespace_cow(text: &str) -> Cow<'_, str> {
 /// Text with entities decoded
 #[must_use]
 pub fn decode_html_entities(text: &str) -> String {
-    html_escape::decode_html_entities(text).into_owned()
+    decode_html_entities_cow(text).into_owned()
 }
 
 /// Decode HTML entities in text, returning borrowed or owned result as needed.
@@ -343,6 +300,8 @@ mod tests {
         assert_eq!(escape("foo [bar]", true, false, false, false), r"foo \[bar\]");
         assert_eq!(escape("1. Item", true, false, false, false), r"1\. Item");
         assert_eq!(escape("1) Item", true, false, false, false), r"1\) Item");
+        assert_eq!(escape("12.5 - 3)", true, false, false, false), r"12\.5 \- 3\)");
+        assert_eq!(escape("a.b) \\", true, false, false, false), r"a.b) \\");
     }
 
     #[test]
@@ -357,6 +316,13 @@ mod tests {
         assert_eq!(escape("__bold__", false, false, true, false), r"\_\_bold\_\_");
     }
 
+    #[test]
+    fn test_escape_asterisks_and_underscores() {
+        assert_eq!(escape("*a_b*", false, true, true, false), r"\*a\_b\*");
+        assert_eq!(escape("ä*ö_ü", false, true, true, false), r"ä\*ö\_ü");
+        assert_eq!(escape("[*]", true, true, false, false), r"\[\*\]");
+    }
+
     #[test]
     fn test_escape_ascii() {
         assert_eq!(escape(r##"!"#$%&"##, false, false, false, true), r##"\!\"\#\$\%\&"##);
@@ -8,6 +8,7 @@ Both APIs use the same Rust backend, so this measures API overhead only.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pytest
@@ -30,6 +31,7 @@ except ImportError:
 BENCHMARK_DIR = TEST_DOCUMENTS_DIR / "html" / "wikipedia"
 
 
+@cache
 def _load_wikipedia_doc(filename: str) -> str:
     filepath = BENCHMARK_DIR / filename
     if not filepath.exists():
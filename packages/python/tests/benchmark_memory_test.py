@@ -3,6 +3,8 @@ from __future__ import annotations
 import gc
 import tracemalloc
 from contextlib import contextmanager
+from itertools import pairwise
+from statistics import median
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -110,29 +112,41 @@ class TestMemoryProfiling:
 
     def test_memory_leak_detection(self) -> None:
         html = generate_complex_html(size_factor=20)
+        convert_to_markdown(html)
+        gc.collect()
 
-        memory_usage = []
+        process = psutil.Process()
+        rss_samples = [process.memory_info().rss]
+
+        tracemalloc.start()
+        try:
+            snapshot_before = tracemalloc.take_snapshot()
 
-        for _i in range(5):
-            process = psutil.Process()
-            _memory_before = process.memory_info().rss
+            for _i in range(5):
+                for _ in range(10):
+                    result = convert_to_markdown(html)
+                    assert len(result) > 0
 
-            for _ in range(10):
-                result = convert_to_markdown(html)
-                assert len(result) > 0
+                gc.collect()
+                rss_samples.append(process.memory_info().rss)
 
-            gc.collect()
+            snapshot_after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
 
-            memory_after = process.memory_info().rss
-            memory_usage.append(memory_after)
+        rss_growth = median(after - before for before, after in pairwise(rss_samples))
+        max_acceptable_rss_growth = 1024 * 1024
 
-        if len(memory_usage) >= 3:
-            growth_rate = (memory_usage[-1] - memory_usage[0]) / len(memory_usage)
-            max_acceptable_growth = 1024 * 1024
+        assert rss_growth < max_acceptable_rss_growth, (
+            f"Potential memory leak detected: {rss_growth / 1024 / 1024:.2f}MB RSS growth per round"
+        )
 
-            assert growth_rate < max_acceptable_growth, (
-                f"Potential memory leak detected: {growth_rate / 1024 / 1024:.2f}MB growth per iteration"
-            )
+        python_growth = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+        max_acceptable_python_growth = 5 * 1024 * 1024
+
+        assert python_growth < max_acceptable_python_growth, (
+            f"Python allocations retained across rounds: {python_growth / 1024 / 1024:.2f}MB"
+        )
 
 
 @pytest.mark.skipif(not MEMRAY_AVAILABLE, reason="memray not available on this platform")
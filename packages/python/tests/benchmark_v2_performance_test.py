@@ -8,6 +8,8 @@ import pytest
 
 from html_to_markdown import ConversionOptions, PreprocessingOptions, convert
 
+from .conftest import TEST_DOCUMENTS_DIR
+
 if TYPE_CHECKING:
     from pytest_benchmark.fixture import BenchmarkFixture
 
@@ -16,6 +18,8 @@ try:
 except ImportError:
     from tests.performance_test import generate_complex_html
 
+HOCR_DIR = TEST_DOCUMENTS_DIR / "test_data" / "hocr"
+
 
 class TestBenchmarkCore:
     @pytest.mark.benchmark(group="conversion_v2")
@@ -125,3 +129,16 @@ def test_benchmark_scalability(benchmark: BenchmarkFixture, size_factor: int) ->
     input_size_mb = len(html) / (1024 * 1024)
     benchmark.extra_info["input_size_mb"] = round(input_size_mb, 3)
     benchmark.extra_info["size_factor"] = size_factor
+
+
+@pytest.mark.benchmark(group="hocr_v2")
+@pytest.mark.parametrize(
+    "filename",
+    ["english_pdf_default.hocr", "german_pdf_german.hocr", "v4_embedded_tables.hocr", "v4_code_formula.hocr"],
+)
+def test_benchmark_hocr_conversion(benchmark: BenchmarkFixture, filename: str) -> None:
+    hocr = (HOCR_DIR / filename).read_text(encoding="utf-8")
+    result = benchmark(convert, hocr)
+    assert len(result) > 0
+
+    benchmark.extra_info["input_size_kb"] = round(len(hocr) / 1024, 1)
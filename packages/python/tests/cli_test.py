@@ -182,6 +182,8 @@ def test_special_characters_integration() -> None:
     stdout, _, _ = run_cli_command([], input_text=input_html)
     assert "*" in stdout
     assert "_" in stdout
+    assert "\\*" not in stdout
+    assert "\\_" not in stdout
 
     stdout, _, _ = run_cli_command(["--escape-asterisks", "--escape-underscores"], input_text=input_html)
     assert "\\*" in stdout
@@ -19,7 +19,7 @@ def parser() -> str:
     return "html.parser"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def convert_v2() -> Callable[..., str]:
     def _convert(
         html: str,
@@ -104,12 +104,12 @@ def convert_v2() -> Callable[..., str]:
     return _convert
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def convert(convert_v2: Callable[..., str]) -> Callable[..., str]:
     return convert_v2
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_uls() -> str:
     return """
     <ul>
@@ -131,7 +131,7 @@ def nested_uls() -> str:
     </ul>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_ols() -> str:
     return """
     <ol>
@@ -153,7 +153,7 @@ def nested_ols() -> str:
     </ul>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table() -> str:
     return """<table>
     <tr>
@@ -174,7 +174,7 @@ def table() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_html_content() -> str:
     return """<table>
     <tr>
@@ -195,7 +195,7 @@ def table_with_html_content() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_paragraphs() -> str:
     return """<table>
     <tr>
@@ -216,7 +216,7 @@ def table_with_paragraphs() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_linebreaks() -> str:
     return """<table>
     <tr>
@@ -239,7 +239,7 @@ def table_with_linebreaks() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_header_column() -> str:
     return """<table>
     <tr>
@@ -260,7 +260,7 @@ def table_with_header_column() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_head_body() -> str:
     return """<table>
     <thead>
@@ -285,7 +285,7 @@ def table_head_body() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_head_body_missing_head() -> str:
     return """<table>
     <thead>
@@ -310,7 +310,7 @@ def table_head_body_missing_head() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_missing_text() -> str:
     return """<table>
     <thead>
@@ -335,7 +335,7 @@ def table_missing_text() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_missing_head() -> str:
     return """<table>
     <tr>
@@ -356,7 +356,7 @@ def table_missing_head() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_body() -> str:
     return """<table>
     <tbody>
@@ -379,7 +379,7 @@ def table_body() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_caption() -> str:
     return """TEXT<table><caption>Caption</caption>
     <tbody><tr><td>Firstname</td>
@@ -390,7 +390,7 @@ def table_with_caption() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_colspan() -> str:
     return """<table>
     <tr>
@@ -410,7 +410,7 @@ def table_with_colspan() -> str:
 </table>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_with_undefined_colspan() -> str:
     return """<table>
     <tr>
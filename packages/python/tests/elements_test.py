@@ -6,6 +6,7 @@ ruby elements, text elements, and structural elements.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,17 +14,24 @@ if TYPE_CHECKING:
 
 import pytest
 
+from .conftest import TEST_DOCUMENTS_DIR
 
-def test_cite_element(convert: Callable[..., str]) -> None:
-    html = "<cite>Author Name</cite>"
-    result = convert(html)
-    assert result == "*Author Name*\n"
+FORMS_DIR = TEST_DOCUMENTS_DIR / "html" / "forms"
 
 
-def test_cite_with_whitespace(convert: Callable[..., str]) -> None:
-    html = "<cite>  Author Name  </cite>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<cite>Author Name</cite>", "*Author Name*\n"),
+        ("<cite>  Author Name  </cite>", "*Author Name*\n"),
+        ("<cite></cite>", ""),
+        ("<cite>Author <strong>Name</strong></cite>", "*Author **Name***\n"),
+        ('<cite><a href="https://example.com">Author Name</a></cite>', "*[Author Name](https://example.com)*\n"),
+    ],
+)
+def test_cite_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "*Author Name*\n"
+    assert result == expected
 
 
 def test_cite_inline_mode(convert: Callable[..., str]) -> None:
@@ -32,34 +40,21 @@ def test_cite_inline_mode(convert: Callable[..., str]) -> None:
     assert result == "Author Name\n"
 
 
-def test_empty_cite(convert: Callable[..., str]) -> None:
-    html = "<cite></cite>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_cite_with_nested_elements(convert: Callable[..., str]) -> None:
-    html = "<cite>Author <strong>Name</strong></cite>"
-    result = convert(html)
-    assert result == "*Author **Name***\n"
-
-
-def test_cite_with_link(convert: Callable[..., str]) -> None:
-    html = '<cite><a href="https://example.com">Author Name</a></cite>'
-    result = convert(html)
-    assert result == "*[Author Name](https://example.com)*\n"
-
-
-def test_q_element(convert: Callable[..., str]) -> None:
-    html = "<q>Short quotation</q>"
-    result = convert(html)
-    assert result == '"Short quotation"\n'
-
-
-def test_q_with_whitespace(convert: Callable[..., str]) -> None:
-    html = "<q>  Short quotation  </q>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<q>Short quotation</q>", '"Short quotation"\n'),
+        ("<q>  Short quotation  </q>", '"Short quotation"\n'),
+        ("<q></q>", ""),
+        ('<q>He said "Hello" to me</q>', '"He said \\"Hello\\" to me"\n'),
+        ("<q>A <em>short</em> quotation</q>", '"A *short* quotation"\n'),
+        ("<q>The function <code>print()</code> outputs text</q>", '"The function `print()` outputs text"\n'),
+        ("<q>Outer quote <q>inner quote</q> continues</q>", '"Outer quote \\"inner quote\\" continues"\n'),
+    ],
+)
+def test_q_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == '"Short quotation"\n'
+    assert result == expected
 
 
 def test_q_inline_mode(convert: Callable[..., str]) -> None:
@@ -68,36 +63,6 @@ def test_q_inline_mode(convert: Callable[..., str]) -> None:
     assert result == "Short quotation\n"
 
 
-def test_empty_q(convert: Callable[..., str]) -> None:
-    html = "<q></q>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_q_with_existing_quotes(convert: Callable[..., str]) -> None:
-    html = '<q>He said "Hello" to me</q>'
-    result = convert(html)
-    assert result == '"He said \\"Hello\\" to me"\n'
-
-
-def test_q_with_nested_elements(convert: Callable[..., str]) -> None:
-    html = "<q>A <em>short</em> quotation</q>"
-    result = convert(html)
-    assert result == '"A *short* quotation"\n'
-
-
-def test_q_with_code(convert: Callable[..., str]) -> None:
-    html = "<q>The function <code>print()</code> outputs text</q>"
-    result = convert(html)
-    assert result == '"The function `print()` outputs text"\n'
-
-
-def test_nested_q_elements(convert: Callable[..., str]) -> None:
-    html = "<q>Outer quote <q>inner quote</q> continues</q>"
-    result = convert(html)
-    assert result == '"Outer quote \\"inner quote\\" continues"\n'
-
-
 @pytest.mark.parametrize(
     "html,expected",
     [
@@ -331,483 +296,197 @@ def test_definition_list_attributes(convert: Callable[..., str]) -> None:
     assert result == expected
 
 
-def test_form_basic(convert: Callable[..., str]) -> None:
-    html = "<form><p>Form content</p></form>"
-    result = convert(html)
-    assert result == "Form content\n"
-
-
-def test_form_with_action(convert: Callable[..., str]) -> None:
-    html = '<form action="/submit"><p>Form content</p></form>'
-    result = convert(html)
-    assert result == "Form content\n"
-
-
-def test_form_with_method(convert: Callable[..., str]) -> None:
-    html = '<form method="post"><p>Form content</p></form>'
-    result = convert(html)
-    assert result == "Form content\n"
-
-
-def test_form_with_action_and_method(convert: Callable[..., str]) -> None:
-    html = '<form action="/submit" method="post"><p>Form content</p></form>'
-    result = convert(html)
-    assert result == "Form content\n"
-
-
-def test_form_empty(convert: Callable[..., str]) -> None:
-    html = "<form></form>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_form_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<form>Form content</form>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Form content\n"
-
-
-def test_fieldset_basic(convert: Callable[..., str]) -> None:
-    html = "<fieldset><p>Fieldset content</p></fieldset>"
-    result = convert(html)
-    assert result == "Fieldset content\n"
-
-
-def test_fieldset_with_legend(convert: Callable[..., str]) -> None:
-    html = "<fieldset><legend>Form Section</legend><p>Content</p></fieldset>"
-    result = convert(html)
-    assert result == "**Form Section**\n\nContent\n"
-
-
-def test_legend_standalone(convert: Callable[..., str]) -> None:
-    html = "<legend>Legend text</legend>"
-    result = convert(html)
-    assert result == "**Legend text**\n"
-
-
-def test_fieldset_empty(convert: Callable[..., str]) -> None:
-    html = "<fieldset></fieldset>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_legend_empty(convert: Callable[..., str]) -> None:
-    html = "<legend></legend>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_fieldset_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<fieldset>Inline content</fieldset>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Inline content\n"
-
-
-def test_label_basic(convert: Callable[..., str]) -> None:
-    html = "<label>Label text</label>"
-    result = convert(html)
-    assert result == "Label text\n"
+@cache
+def load_form_fixture(name: str) -> tuple[str, str]:
+    html = (FORMS_DIR / f"{name}.html").read_text(encoding="utf-8")
+    expected = (FORMS_DIR / f"{name}.md").read_text(encoding="utf-8")
+    return html, expected
 
 
-def test_label_with_for(convert: Callable[..., str]) -> None:
-    html = '<label for="username">Username</label>'
-    result = convert(html)
-    assert result == "Username\n"
-
-
-def test_label_with_input(convert: Callable[..., str]) -> None:
-    html = '<label>Username: <input type="text" name="username"></label>'
-    result = convert(html)
-    assert result == "Username:\n"
-
-
-def test_label_empty(convert: Callable[..., str]) -> None:
-    html = "<label></label>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_label_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<label>Inline label</label>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Inline label\n"
-
-
-def test_input_text(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_password(convert: Callable[..., str]) -> None:
-    html = '<input type="password" name="password">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_with_value(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username" value="john">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_with_placeholder(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username" placeholder="Enter username">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_required(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username" required>'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_disabled(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username" disabled>'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_readonly(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username" readonly>'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_checkbox_unchecked(convert: Callable[..., str]) -> None:
-    html = '<input type="checkbox" name="agree">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_checkbox_checked(convert: Callable[..., str]) -> None:
-    html = '<input type="checkbox" name="agree" checked>'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_radio(convert: Callable[..., str]) -> None:
-    html = '<input type="radio" name="gender" value="male">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_submit(convert: Callable[..., str]) -> None:
-    html = '<input type="submit" value="Submit">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_file(convert: Callable[..., str]) -> None:
-    html = '<input type="file" name="upload" accept=".jpg,.png">'
-    result = convert(html)
-    assert result == ""
-
-
-def test_input_inline_mode(convert: Callable[..., str]) -> None:
-    html = '<input type="text" name="username">'
-    result = convert(html, convert_as_inline=True)
-    assert result == ""
-
-
-def test_textarea_basic(convert: Callable[..., str]) -> None:
-    html = "<textarea>Default text</textarea>"
-    result = convert(html)
-    assert result == "Default text\n"
-
-
-def test_textarea_with_name(convert: Callable[..., str]) -> None:
-    html = '<textarea name="comment">Comment text</textarea>'
-    result = convert(html)
-    assert result == "Comment text\n"
-
-
-def test_textarea_with_placeholder(convert: Callable[..., str]) -> None:
-    html = '<textarea placeholder="Enter your comment">Default text</textarea>'
-    result = convert(html)
-    assert result == "Default text\n"
-
-
-def test_textarea_with_rows_cols(convert: Callable[..., str]) -> None:
-    html = '<textarea rows="5" cols="30">Text</textarea>'
-    result = convert(html)
-    assert result == "Text\n"
-
-
-def test_textarea_required(convert: Callable[..., str]) -> None:
-    html = "<textarea required>Required text</textarea>"
-    result = convert(html)
-    assert result == "Required text\n"
-
-
-def test_textarea_empty(convert: Callable[..., str]) -> None:
-    html = "<textarea></textarea>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_textarea_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<textarea>Inline text</textarea>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Inline text\n"
-
-
-def test_select_basic(convert: Callable[..., str]) -> None:
-    html = "<select><option>Option 1</option><option>Option 2</option></select>"
-    result = convert(html)
-    assert result == "Option 1\nOption 2\n"
-
-
-def test_select_with_name(convert: Callable[..., str]) -> None:
-    html = '<select name="country"><option>USA</option><option>Canada</option></select>'
-    result = convert(html)
-    assert result == "USA\nCanada\n"
-
-
-def test_select_multiple(convert: Callable[..., str]) -> None:
-    html = "<select multiple><option>Option 1</option><option>Option 2</option></select>"
-    result = convert(html)
-    assert result == "Option 1\nOption 2\n"
-
-
-def test_option_with_value(convert: Callable[..., str]) -> None:
-    html = '<select><option value="us">United States</option><option value="ca">Canada</option></select>'
-    result = convert(html)
-    assert result == "United States\nCanada\n"
-
-
-def test_option_selected(convert: Callable[..., str]) -> None:
-    html = "<select><option>Option 1</option><option selected>Option 2</option></select>"
-    result = convert(html)
-    assert result == "Option 1\n* Option 2\n"
-
-
-def test_optgroup(convert: Callable[..., str]) -> None:
-    html = '<select><optgroup label="Group 1"><option>Option 1</option><option>Option 2</option></optgroup></select>'
-    result = convert(html)
-    assert result == "**Group 1**\nOption 1\nOption 2\n"
-
-
-def test_select_empty(convert: Callable[..., str]) -> None:
-    html = "<select></select>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_option_empty(convert: Callable[..., str]) -> None:
-    html = "<select><option></option></select>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_select_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<select><option>Option</option></select>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Option\n"
-
-
-def test_button_basic(convert: Callable[..., str]) -> None:
-    html = "<button>Click me</button>"
-    result = convert(html)
-    assert result == "Click me\n"
-
-
-def test_button_with_type(convert: Callable[..., str]) -> None:
-    html = '<button type="submit">Submit</button>'
-    result = convert(html)
-    assert result == "Submit\n"
-
-
-def test_button_disabled(convert: Callable[..., str]) -> None:
-    html = "<button disabled>Disabled</button>"
-    result = convert(html)
-    assert result == "Disabled\n"
-
-
-def test_button_with_name_value(convert: Callable[..., str]) -> None:
-    html = '<button name="action" value="delete">Delete</button>'
-    result = convert(html)
-    assert result == "Delete\n"
-
-
-def test_button_empty(convert: Callable[..., str]) -> None:
-    html = "<button></button>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_button_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<button>Inline button</button>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Inline button\n"
-
-
-def test_progress_basic(convert: Callable[..., str]) -> None:
-    html = "<progress>50%</progress>"
-    result = convert(html)
-    assert result == "50%\n"
-
-
-def test_progress_with_value_max(convert: Callable[..., str]) -> None:
-    html = '<progress value="50" max="100">50%</progress>'
-    result = convert(html)
-    assert result == "50%\n"
-
-
-def test_meter_basic(convert: Callable[..., str]) -> None:
-    html = "<meter>6 out of 10</meter>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<form><p>Form content</p></form>", "Form content\n"),
+        ('<form action="/submit"><p>Form content</p></form>', "Form content\n"),
+        ('<form method="post"><p>Form content</p></form>', "Form content\n"),
+        ('<form action="/submit" method="post"><p>Form content</p></form>', "Form content\n"),
+        ("<form></form>", ""),
+    ],
+)
+def test_form_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "6 out of 10\n"
+    assert result == expected
 
 
-def test_meter_with_attributes(convert: Callable[..., str]) -> None:
-    html = '<meter value="6" min="0" max="10" low="2" high="8" optimum="5">6 out of 10</meter>'
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<fieldset><p>Fieldset content</p></fieldset>", "Fieldset content\n"),
+        ("<fieldset><legend>Form Section</legend><p>Content</p></fieldset>", "**Form Section**\n\nContent\n"),
+        ("<fieldset></fieldset>", ""),
+        ("<legend>Legend text</legend>", "**Legend text**\n"),
+        ("<legend></legend>", ""),
+    ],
+)
+def test_fieldset_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "6 out of 10\n"
+    assert result == expected
 
 
-def test_progress_empty(convert: Callable[..., str]) -> None:
-    html = "<progress></progress>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<label>Label text</label>", "Label text\n"),
+        ('<label for="username">Username</label>', "Username\n"),
+        ('<label>Username: <input type="text" name="username"></label>', "Username:\n"),
+        ("<label></label>", ""),
+    ],
+)
+def test_label_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == ""
+    assert result == expected
 
 
-def test_meter_empty(convert: Callable[..., str]) -> None:
-    html = "<meter></meter>"
-    result = convert(html)
+@pytest.mark.parametrize(
+    "attrs",
+    [
+        'type="text" name="username"',
+        'type="password" name="password"',
+        'type="text" name="username" value="john"',
+        'type="text" name="username" placeholder="Enter username"',
+        'type="text" name="username" required',
+        'type="text" name="username" disabled',
+        'type="text" name="username" readonly',
+        'type="checkbox" name="agree"',
+        'type="checkbox" name="agree" checked',
+        'type="radio" name="gender" value="male"',
+        'type="submit" value="Submit"',
+        'type="file" name="upload" accept=".jpg,.png"',
+    ],
+)
+def test_input_elements(attrs: str, convert: Callable[..., str]) -> None:
+    result = convert(f"<input {attrs}>")
     assert result == ""
 
 
-def test_progress_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<progress>50%</progress>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "50%\n"
-
-
-def test_meter_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<meter>6/10</meter>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "6/10\n"
-
-
-def test_output_basic(convert: Callable[..., str]) -> None:
-    html = "<output>Result: 42</output>"
-    result = convert(html)
-    assert result == "Result: 42\n"
-
-
-def test_output_with_for(convert: Callable[..., str]) -> None:
-    html = '<output for="input1 input2">Sum: 15</output>'
-    result = convert(html)
-    assert result == "Sum: 15\n"
-
-
-def test_output_with_name(convert: Callable[..., str]) -> None:
-    html = '<output name="result">42</output>'
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<textarea>Default text</textarea>", "Default text\n"),
+        ('<textarea name="comment">Comment text</textarea>', "Comment text\n"),
+        ('<textarea placeholder="Enter your comment">Default text</textarea>', "Default text\n"),
+        ('<textarea rows="5" cols="30">Text</textarea>', "Text\n"),
+        ("<textarea required>Required text</textarea>", "Required text\n"),
+        ("<textarea></textarea>", ""),
+    ],
+)
+def test_textarea_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "42\n"
+    assert result == expected
 
 
-def test_datalist_basic(convert: Callable[..., str]) -> None:
-    html = "<datalist><option>Option 1</option><option>Option 2</option></datalist>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<select><option>Option 1</option><option>Option 2</option></select>", "Option 1\nOption 2\n"),
+        ('<select name="country"><option>USA</option><option>Canada</option></select>', "USA\nCanada\n"),
+        ("<select multiple><option>Option 1</option><option>Option 2</option></select>", "Option 1\nOption 2\n"),
+        ("<select></select>", ""),
+        (
+            '<select><option value="us">United States</option><option value="ca">Canada</option></select>',
+            "United States\nCanada\n",
+        ),
+        ("<select><option>Option 1</option><option selected>Option 2</option></select>", "Option 1\n* Option 2\n"),
+        ("<select><option></option></select>", ""),
+        (
+            '<select><optgroup label="Group 1"><option>Option 1</option><option>Option 2</option></optgroup></select>',
+            "**Group 1**\nOption 1\nOption 2\n",
+        ),
+    ],
+)
+def test_select_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "Option 1\nOption 2\n"
+    assert result == expected
 
 
-def test_datalist_with_id(convert: Callable[..., str]) -> None:
-    html = '<datalist id="browsers"><option>Chrome</option><option>Firefox</option></datalist>'
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<button>Click me</button>", "Click me\n"),
+        ('<button type="submit">Submit</button>', "Submit\n"),
+        ("<button disabled>Disabled</button>", "Disabled\n"),
+        ('<button name="action" value="delete">Delete</button>', "Delete\n"),
+        ("<button></button>", ""),
+    ],
+)
+def test_button_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "Chrome\nFirefox\n"
+    assert result == expected
 
 
-def test_output_empty(convert: Callable[..., str]) -> None:
-    html = "<output></output>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<progress>50%</progress>", "50%\n"),
+        ('<progress value="50" max="100">50%</progress>', "50%\n"),
+        ("<progress></progress>", ""),
+        ("<meter>6 out of 10</meter>", "6 out of 10\n"),
+        ('<meter value="6" min="0" max="10" low="2" high="8" optimum="5">6 out of 10</meter>', "6 out of 10\n"),
+        ("<meter></meter>", ""),
+    ],
+)
+def test_progress_and_meter_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == ""
+    assert result == expected
 
 
-def test_datalist_empty(convert: Callable[..., str]) -> None:
-    html = "<datalist></datalist>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<output>Result: 42</output>", "Result: 42\n"),
+        ('<output for="input1 input2">Sum: 15</output>', "Sum: 15\n"),
+        ('<output name="result">42</output>', "42\n"),
+        ("<output></output>", ""),
+        ("<datalist><option>Option 1</option><option>Option 2</option></datalist>", "Option 1\nOption 2\n"),
+        ('<datalist id="browsers"><option>Chrome</option><option>Firefox</option></datalist>', "Chrome\nFirefox\n"),
+        ("<datalist></datalist>", ""),
+    ],
+)
+def test_output_and_datalist_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == ""
-
-
-def test_output_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<output>Result</output>"
-    result = convert(html, convert_as_inline=True)
-    assert result == "Result\n"
+    assert result == expected
 
 
-def test_datalist_inline_mode(convert: Callable[..., str]) -> None:
-    html = "<datalist><option>Option</option></datalist>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<form>Form content</form>", "Form content\n"),
+        ("<fieldset>Inline content</fieldset>", "Inline content\n"),
+        ("<label>Inline label</label>", "Inline label\n"),
+        ('<input type="text" name="username">', ""),
+        ("<textarea>Inline text</textarea>", "Inline text\n"),
+        ("<select><option>Option</option></select>", "Option\n"),
+        ("<button>Inline button</button>", "Inline button\n"),
+        ("<progress>50%</progress>", "50%\n"),
+        ("<meter>6/10</meter>", "6/10\n"),
+        ("<output>Result</output>", "Result\n"),
+        ("<datalist><option>Option</option></datalist>", "Option\n"),
+    ],
+)
+def test_form_elements_inline_mode(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html, convert_as_inline=True)
-    assert result == "Option\n"
+    assert result == expected
 
 
 def test_complete_form_example(convert: Callable[..., str]) -> None:
-    html = """<form action="/submit" method="post">
-        <fieldset>
-            <legend>Personal Information</legend>
-            <label for="name">Name:</label>
-            <input type="text" id="name" name="name" required>
-            <label for="email">Email:</label>
-            <input type="email" id="email" name="email" required>
-        </fieldset>
-        <fieldset>
-            <legend>Preferences</legend>
-            <label>
-                <input type="checkbox" name="newsletter" checked>
-                Subscribe to newsletter
-            </label>
-            <label for="country">Country:</label>
-            <select id="country" name="country">
-                <option value="us">United States</option>
-                <option value="ca">Canada</option>
-            </select>
-        </fieldset>
-        <button type="submit">Submit</button>
-    </form>"""
-    result = convert(html)
-    expected = """**Personal Information**
-
-Name:
-
-Email:
-
-**Preferences**
-
-Subscribe to newsletter
-
-Country:
-
-United States
-Canada
-
-Submit
-"""
+    html, expected = load_form_fixture("complete_form")
+    result = convert(html)
     assert result == expected
 
 
 def test_form_with_progress_and_meter(convert: Callable[..., str]) -> None:
-    html = """<form>
-        <label>Upload Progress:</label>
-        <progress value="75" max="100">75%</progress>
-        <label>Rating:</label>
-        <meter value="4" min="1" max="5">4 out of 5</meter>
-        <output for="rating">Current rating: 4/5</output>
-    </form>"""
+    html, expected = load_form_fixture("form_with_progress_and_meter")
     result = convert(html)
-    expected = """Upload Progress:
-
-75%
-
-Rating:
-
-4 out of 5
-
-Current rating: 4/5
-"""
     assert result == expected
 
 
@@ -817,46 +496,23 @@ def test_form_with_inputs_inline_mode(convert: Callable[..., str]) -> None:
     assert result == "Name:  Submit\n"
 
 
-def test_article_element(convert: Callable[..., str]) -> None:
-    html = "<article>This is an article</article>"
-    result = convert(html)
-    assert result == "This is an article\n"
-
-
-def test_section_element(convert: Callable[..., str]) -> None:
-    html = "<section>This is a section</section>"
-    result = convert(html)
-    assert result == "This is a section\n"
-
-
-def test_nav_element(convert: Callable[..., str]) -> None:
-    html = "<nav>This is navigation</nav>"
-    result = convert(html)
-    assert result == "This is navigation\n"
-
-
-def test_aside_element(convert: Callable[..., str]) -> None:
-    html = "<aside>This is an aside</aside>"
-    result = convert(html)
-    assert result == "This is an aside\n"
-
-
-def test_header_element(convert: Callable[..., str]) -> None:
-    html = "<header>This is a header</header>"
-    result = convert(html)
-    assert result == "This is a header\n"
-
-
-def test_footer_element(convert: Callable[..., str]) -> None:
-    html = "<footer>This is a footer</footer>"
-    result = convert(html)
-    assert result == "This is a footer\n"
-
-
-def test_main_element(convert: Callable[..., str]) -> None:
-    html = "<main>This is main content</main>"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<article>This is an article</article>", "This is an article\n"),
+        ("<section>This is a section</section>", "This is a section\n"),
+        ("<nav>This is navigation</nav>", "This is navigation\n"),
+        ("<aside>This is an aside</aside>", "This is an aside\n"),
+        ("<header>This is a header</header>", "This is a header\n"),
+        ("<footer>This is a footer</footer>", "This is a footer\n"),
+        ("<main>This is main content</main>", "This is main content\n"),
+        ("<article></article>", ""),
+        ("<section>  \n  Content with whitespace  \n  </section>", " Content with whitespace\n"),
+    ],
+)
+def test_semantic_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    assert result == "This is main content\n"
+    assert result == expected
 
 
 def test_article_with_sections(convert: Callable[..., str]) -> None:
@@ -873,69 +529,39 @@ def test_semantic_elements_with_other_content(convert: Callable[..., str]) -> No
     assert result == expected
 
 
-def test_empty_article_element(convert: Callable[..., str]) -> None:
-    html = "<article></article>"
-    result = convert(html)
-    assert result == ""
-
-
 def test_article_inline_mode(convert: Callable[..., str]) -> None:
     html = "<article>This is inline content</article>"
     result = convert(html, convert_as_inline=True)
     assert result == "This is inline content\n"
 
 
-def test_semantic_elements_with_whitespace(convert: Callable[..., str]) -> None:
-    html = "<section>  \n  Content with whitespace  \n  </section>"
-    result = convert(html)
-    assert result == " Content with whitespace\n"
-
-
-def test_details_element(convert: Callable[..., str]) -> None:
-    html = "<details>This is details content</details>"
-    result = convert(html)
-    assert result == "This is details content\n"
-
-
-def test_summary_element(convert: Callable[..., str]) -> None:
-    html = "<summary>Summary text</summary>"
-    result = convert(html)
-    assert result == "**Summary text**\n"
-
-
-def test_details_with_summary(convert: Callable[..., str]) -> None:
-    html = "<details><summary>Click to expand</summary><p>Hidden content here</p></details>"
-    result = convert(html)
-    expected = "**Click to expand**\n\nHidden content here\n"
-    assert result == expected
-
-
-def test_nested_details(convert: Callable[..., str]) -> None:
-    html = "<details><summary>Level 1</summary><details><summary>Level 2</summary><p>Nested content</p></details></details>"
-    result = convert(html)
-    expected = "**Level 1**\n\n**Level 2**\n\nNested content\n"
-    assert result == expected
-
-
-def test_details_with_complex_content(convert: Callable[..., str]) -> None:
-    html = '<details><summary>Code Example</summary><pre><code>def hello():\n    print("Hello, World!")</code></pre><p>This is a Python function.</p></details>'
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<details>This is details content</details>", "This is details content\n"),
+        ("<summary>Summary text</summary>", "**Summary text**\n"),
+        (
+            "<details><summary>Click to expand</summary><p>Hidden content here</p></details>",
+            "**Click to expand**\n\nHidden content here\n",
+        ),
+        (
+            "<details><summary>Level 1</summary><details><summary>Level 2</summary><p>Nested content</p></details></details>",
+            "**Level 1**\n\n**Level 2**\n\nNested content\n",
+        ),
+        (
+            '<details><summary>Code Example</summary><pre><code>def hello():\n    print("Hello, World!")</code></pre><p>This is a Python function.</p></details>',
+            '**Code Example**\n\n```\ndef hello():\n    print("Hello, World!")\n```\nThis is a Python function.\n',
+        ),
+        ("<details></details>", ""),
+        ("<summary></summary>", ""),
+        ("<details open><summary>Always open</summary><p>Content</p></details>", "**Always open**\n\nContent\n"),
+    ],
+)
+def test_details_and_summary_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
     result = convert(html)
-    expected = '**Code Example**\n\n```\ndef hello():\n    print("Hello, World!")\n```\nThis is a Python function.\n'
     assert result == expected
 
 
-def test_empty_details(convert: Callable[..., str]) -> None:
-    html = "<details></details>"
-    result = convert(html)
-    assert result == ""
-
-
-def test_empty_summary(convert: Callable[..., str]) -> None:
-    html = "<summary></summary>"
-    result = convert(html)
-    assert result == ""
-
-
 def test_details_inline_mode(convert: Callable[..., str]) -> None:
     html = "<details>Inline details</details>"
     result = convert(html, convert_as_inline=True)
@@ -948,13 +574,6 @@ def test_summary_inline_mode(convert: Callable[..., str]) -> None:
     assert result == "Inline summary\n"
 
 
-def test_details_with_attributes(convert: Callable[..., str]) -> None:
-    html = "<details open><summary>Always open</summary><p>Content</p></details>"
-    result = convert(html)
-    expected = "**Always open**\n\nContent\n"
-    assert result == expected
-
-
 def test_audio_basic(convert: Callable[..., str]) -> None:
     html = '<audio src="audio.mp3"></audio>'
     result = convert(html)
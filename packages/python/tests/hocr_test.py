@@ -5,7 +5,6 @@ structured text with positioning and confidence information.
 """
 
 import re
-from pathlib import Path
 from typing import Any
 
 import pytest
@@ -14,17 +13,39 @@ from html_to_markdown import ConversionOptions, convert
 
 from .conftest import TEST_DOCUMENTS_DIR
 
+pytestmark = pytest.mark.hocr
 
-def get_hocr_file(filename: str) -> Path:
-    return TEST_DOCUMENTS_DIR / "test_data" / "hocr" / filename
+HOCR_DIR = TEST_DOCUMENTS_DIR / "test_data" / "hocr"
+
+MULTILINGUAL_TOKENS = (
+    "The (quick)",
+    "[brown]",
+    "{fox} jumps!",
+    "Der ,.schnelle",
+    "Le renard brun",
+    "La volpe marrone",
+    "$43,456",
+    "aspammer@website.com",
+)
+_NON_EMPTY_LINE_RE = re.compile(r"^[^\S\n]*(\S(?:[^\n]*\S)?)", re.MULTILINE)
+
+
+@pytest.fixture(scope="session")
+def hocr_corpus() -> dict[str, str]:
+    return {
+        path.relative_to(HOCR_DIR).as_posix(): path.read_text(encoding="utf-8") for path in HOCR_DIR.rglob("*.hocr")
+    }
+
+
+def forbidden_tokens(text: str, *tokens: str) -> set[str]:
+    return {token for token in tokens if token in text}
 
 
 def get_expected_markdown(filename: str) -> str:
     return (TEST_DOCUMENTS_DIR / "test_data" / "hocr_expected" / filename).read_text(encoding="utf-8")
 
 
-def convert_hocr_file(filename: str, **kwargs: Any) -> str:
-    hocr_content = get_hocr_file(filename).read_text(encoding="utf-8")
+def convert_hocr(hocr_content: str, **kwargs: Any) -> str:
     result = convert(hocr_content, **kwargs)
     assert isinstance(result, str)
     return result
@@ -72,6 +93,73 @@ MATH_PARAGRAPH_HOCR = """<?xml version="1.0" encoding="UTF-8"?>
 </html>
 """
 
+MALFORMED_HOCR_CASES = [
+    ('<div class="ocr_page"><span class="ocrx_word">unclosed', "unclosed"),
+    (f'<div class="ocr_page"><span class="ocrx_word {"x" * 10000}">test</span></div>', "test"),
+    (
+        '<div class="ocr_page">' + "<div>" * 100 + '<span class="ocrx_word">deep</span>' + "</div>" * 100 + "</div>",
+        "deep",
+    ),
+]
+
+MINIMAL_HOCR = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN"
+    "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
+ <head>
+  <meta name='ocr-system' content='tesseract 5.5.1' />
+ </head>
+ <body>
+  <div class='ocr_page' id='page_1'>
+  </div>
+ </body>
+</html>"""
+
+TABLE_HOCR = """
+    <html>
+    <body>
+        <div class="ocr_page">
+            <div class="ocr_table">
+                <span class="ocrx_word" title="bbox 100 50 140 70; x_wconf 95">Product</span>
+                <span class="ocrx_word" title="bbox 200 50 240 70; x_wconf 95">Price</span>
+                <span class="ocrx_word" title="bbox 300 50 340 70; x_wconf 95">Stock</span>
+                <span class="ocrx_word" title="bbox 100 100 140 120; x_wconf 95">Apple</span>
+                <span class="ocrx_word" title="bbox 200 100 240 120; x_wconf 95">$1.50</span>
+                <span class="ocrx_word" title="bbox 300 100 340 120; x_wconf 95">Yes</span>
+                <span class="ocrx_word" title="bbox 100 150 140 170; x_wconf 95">Orange</span>
+                <span class="ocrx_word" title="bbox 200 150 240 170; x_wconf 95">$2.00</span>
+                <span class="ocrx_word" title="bbox 300 150 340 170; x_wconf 95">No</span>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+UNMARKED_TABLE_HOCR = """
+    <html>
+    <body>
+        <div class="ocr_page">
+            <span class="ocrx_word" title="bbox 100 50 140 70; x_wconf 95">Col1</span>
+            <span class="ocrx_word" title="bbox 200 50 240 70; x_wconf 95">Col2</span>
+            <span class="ocrx_word" title="bbox 100 100 140 120; x_wconf 95">Data1</span>
+            <span class="ocrx_word" title="bbox 200 100 240 120; x_wconf 95">Data2</span>
+        </div>
+    </body>
+    </html>
+    """
+
+WORD_CONFIDENCE_HOCR = """
+    <html>
+    <body>
+        <div class="ocr_page">
+            <span class="ocrx_word" title="bbox 100 50 140 70; x_wconf 95">Good</span>
+            <span class="ocrx_word" title="bbox 200 50 240 70; x_wconf 30">Bad</span>
+            <span class="ocrx_word" title="bbox 100 100 140 120; x_wconf 92">Quality</span>
+        </div>
+    </body>
+    </html>
+    """
+
 
 def normalize_table_rules(markdown: str) -> str:
     def normalize_line(line: str) -> str:
@@ -92,143 +180,133 @@ def get_content_without_frontmatter(markdown: str) -> str:
     return markdown
 
 
-def test_german_pdf_hocr_conversion() -> None:
-    hocr_content = get_hocr_file("german_pdf_german.hocr").read_text(encoding="utf-8")
+def test_german_pdf_hocr_conversion(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["german_pdf_german.hocr"]
 
     options = ConversionOptions(hocr_spatial_tables=False)
     result = convert(hocr_content, options)
 
-    assert "<!--" not in result, "Result should not contain HTML comments"
-    assert "meta-content-type" not in result, "Result should not contain meta tags"
-    assert "meta-ocr-capabilities" not in result, "Result should not contain OCR meta tags"
+    leaked = forbidden_tokens(result, "<!--", "meta-content-type", "meta-ocr-capabilities")
+    assert not leaked, f"Result should not contain HTML comments, meta tags or OCR meta tags: {leaked}"
 
     assert "DR Heimat Bayern" in result, "Should contain German text from document header"
     assert "Bayerischer Landesverein" in result, "Should contain organization name"
     assert "München" in result, "Should contain Munich city name"
     assert "Archivgesetz" in result, "Should contain law reference"
 
-    lines = [line.strip() for line in result.split("\n") if line.strip()]
+    lines = _NON_EMPTY_LINE_RE.findall(result)
     assert len(lines) > 10, "Should have multiple lines of content"
 
-    meaningful_lines = [line for line in lines if not line.startswith("#") and len(line) > 5]
-    assert len(meaningful_lines) > 0, "Should have meaningful content lines"
-
-    first_line = meaningful_lines[0] if meaningful_lines else ""
+    first_line = next((line for line in lines if not line.startswith("#") and len(line) > 5), "")
+    assert first_line, "Should have meaningful content lines"
     assert not first_line.startswith("meta-"), "First line should not be meta information"
 
 
-def test_english_pdf_hocr_conversion() -> None:
-    hocr_content = get_hocr_file("english_pdf_default.hocr").read_text(encoding="utf-8")
+def test_english_pdf_hocr_conversion(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["english_pdf_default.hocr"]
 
     options = ConversionOptions(hocr_spatial_tables=False)
     result = convert(hocr_content, options)
 
-    assert "<!--" not in result, "Result should not contain HTML comments"
-    assert "meta-ocr-system" not in result, "Result should not contain OCR system info"
+    leaked = forbidden_tokens(result, "<!--", "meta-ocr-system")
+    assert not leaked, f"Result should not contain HTML comments or OCR system info: {leaked}"
 
     assert len(result.strip()) > 50, "Should have substantial content"
 
 
-def test_invoice_hocr_conversion() -> None:
-    hocr_content = get_hocr_file("invoice_image_default.hocr").read_text(encoding="utf-8")
+def test_invoice_hocr_conversion(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["invoice_image_default.hocr"]
 
     options = ConversionOptions(hocr_spatial_tables=False)
     result = convert(hocr_content, options)
     content = get_content_without_frontmatter(result)
 
     assert "<!--" not in result, "Result should not contain HTML comments"
-    assert "ocr_page" not in content, "Content should not contain HOCR class names"
-    assert "bbox" not in content, "Content should not contain bounding box info"
+    leaked = forbidden_tokens(content, "ocr_", "bbox")
+    assert not leaked, f"Content should not contain HOCR class names or bbox info: {leaked}"
 
     assert len(result.strip()) > 10, "Should have some content"
 
 
-def test_hocr_with_confidence_and_coordinates() -> None:
-    hocr_content = get_hocr_file("german_pdf_german.hocr").read_text(encoding="utf-8")
+def test_hocr_with_confidence_and_coordinates(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["german_pdf_german.hocr"]
 
     options = ConversionOptions(hocr_spatial_tables=False)
     result = convert(hocr_content, options)
     content = get_content_without_frontmatter(result)
 
-    assert "x_wconf" not in content, "Content should not contain confidence scores"
-    assert "bbox" not in content, "Content should not contain bounding boxes"
-    assert "baseline" not in content, "Content should not contain baseline info"
-    assert "x_size" not in content, "Content should not contain size info"
-    assert "ppageno" not in content, "Content should not contain page number info"
+    leaked = forbidden_tokens(content, "x_wconf", "bbox", "baseline", "x_size", "ppageno")
+    assert not leaked, f"Content should not contain confidence, bounding box, baseline, size or page info: {leaked}"
 
 
-def test_hocr_preserves_text_structure() -> None:
-    hocr_content = get_hocr_file("german_pdf_german.hocr").read_text(encoding="utf-8")
+def test_hocr_preserves_text_structure(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["german_pdf_german.hocr"]
 
     result = convert(hocr_content)
 
-    lines = [line.strip() for line in result.split("\n") if line.strip()]
-    assert len(lines) > 5, "Should preserve multiple text blocks"
+    line_count = sum(1 for _ in _NON_EMPTY_LINE_RE.finditer(result))
+    assert line_count > 5, "Should preserve multiple text blocks"
 
     blank_line_ratio = result.count("\n\n\n") / max(1, result.count("\n"))
     assert blank_line_ratio < 0.3, "Should not have too many consecutive blank lines"
 
 
 def test_empty_hocr_handling() -> None:
-    minimal_hocr = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN"
-    "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">
- <head>
-  <meta name='ocr-system' content='tesseract 5.5.1' />
- </head>
- <body>
-  <div class='ocr_page' id='page_1'>
-  </div>
- </body>
-</html>"""
-
-    result = convert(minimal_hocr)
+    result = convert(MINIMAL_HOCR)
 
     assert isinstance(result, str), "Should return string even for empty HOCR"
     assert "meta" not in result, "Should not contain meta information"
 
 
+@pytest.mark.parametrize("hocr_content,expected_word", MALFORMED_HOCR_CASES)
+def test_malformed_hocr_handling(hocr_content: str, expected_word: str) -> None:
+    result = convert(hocr_content)
+
+    assert isinstance(result, str), "Should return string for malformed HOCR"
+    assert expected_word in result, "Should keep the recognized word text"
+
+
 @pytest.mark.parametrize(
     "hocr_file",
     [
         "german_pdf_german.hocr",
         "english_pdf_default.hocr",
         "invoice_image_default.hocr",
+        "comprehensive/valid_file.hocr",
+        "comprehensive/with_body_tag.hocr",
+        "comprehensive/utf8_encoding.hocr",
+        "comprehensive/word_confidence.hocr",
+        "comprehensive/bbox_overlapping.hocr",
     ],
 )
-def test_all_hocr_files_convert_cleanly(hocr_file: str) -> None:
-    hocr_content = get_hocr_file(hocr_file).read_text(encoding="utf-8")
+def test_all_hocr_files_convert_cleanly(hocr_file: str, hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus[hocr_file]
 
     result = convert(hocr_content)
     content = get_content_without_frontmatter(result)
 
     assert isinstance(result, str), "Should return string"
-    assert "<?xml" not in result, "Should not contain XML declaration"
-    assert "<!DOCTYPE" not in result, "Should not contain DOCTYPE"
-    assert "<html" not in result, "Should not contain HTML tags"
-    assert "ocr_" not in content, "Content should not contain HOCR class names"
-
-
-def test_v4_embedded_tables_hocr_produces_expected_table() -> None:
-    result = convert_hocr_file("v4_embedded_tables.hocr")
-    expected_table = get_expected_markdown("embedded_tables.md").strip()
-    assert normalize_table_rules(expected_table) in normalize_table_rules(result)
+    leaked = forbidden_tokens(result, "<?xml", "<!DOCTYPE", "<html")
+    assert not leaked, f"Should not contain XML declaration, DOCTYPE or HTML tags: {leaked}"
+    leaked = forbidden_tokens(content, "ocr_", "bbox", "x_wconf", "baseline", "ppageno")
+    assert not leaked, (
+        f"Content should not contain HOCR class names, bounding box, confidence, baseline or page number info: {leaked}"
+    )
 
 
-def test_v4_embedded_tables_hocr_toggle_controls_table_reconstruction() -> None:
+def test_v4_embedded_tables_hocr_toggle_controls_table_reconstruction(hocr_corpus: dict[str, str]) -> None:
     expected_table = get_expected_markdown("embedded_tables.md").strip()
 
-    default_result = convert_hocr_file("v4_embedded_tables.hocr")
+    default_result = convert_hocr(hocr_corpus["v4_embedded_tables.hocr"])
     assert normalize_table_rules(expected_table) in normalize_table_rules(default_result)
 
     options = ConversionOptions(hocr_spatial_tables=False)
-    result_without_tables = convert_hocr_file("v4_embedded_tables.hocr", options=options)
+    result_without_tables = convert_hocr(hocr_corpus["v4_embedded_tables.hocr"], options=options)
     assert normalize_table_rules(expected_table) not in normalize_table_rules(result_without_tables)
 
 
-def test_v4_code_formula_hocr_preserves_code_block() -> None:
-    result = convert_hocr_file("v4_code_formula.hocr")
+def test_v4_code_formula_hocr_preserves_code_block(hocr_corpus: dict[str, str]) -> None:
+    result = convert_hocr(hocr_corpus["v4_code_formula.hocr"])
     expected_code = get_expected_markdown("code_formula.md").strip()
     assert expected_code in result
 
@@ -241,103 +319,43 @@ def test_math_paragraph_hocr_does_not_emit_code_block() -> None:
     assert "Let f" in result
 
 
-def test_multilingual_hocr_conversion() -> None:
-    hocr_content = (TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / "valid_file.hocr").read_text(
-        encoding="utf-8"
-    )
+def test_multilingual_hocr_conversion(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["comprehensive/valid_file.hocr"]
 
     options = ConversionOptions(hocr_spatial_tables=False)
     result = convert(hocr_content, options)
     content = get_content_without_frontmatter(result)
 
-    assert "<!--" not in result, "Should not contain HTML comments"
-    assert "<?xml" not in result, "Should not contain XML declaration"
-    assert "ocr_" not in content, "Content should not contain HOCR class names"
-    assert "bbox" not in content, "Content should not contain bounding box info"
-
-    assert "The (quick)" in result, "Should contain English text with proper spacing"
-    assert "[brown]" in result or "\\[brown]" in result, "Should contain bracketed text"
-    assert "{fox} jumps!" in result, "Should contain braced text"
-    assert "Der ,.schnelle" in result, "Should contain German text"
-    assert "Le renard brun" in result, "Should contain French text"
-    assert "La volpe marrone" in result, "Should contain Italian text"
-    assert "$43,456" in result, "Should preserve numbers"
-    assert "aspammer@website.com" in result, "Should preserve email addresses"
-
-
-def test_utf8_encoding_hocr() -> None:
-    hocr_content = (TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / "utf8_encoding.hocr").read_text(
-        encoding="utf-8"
-    )
+    leaked = forbidden_tokens(result, "<!--", "<?xml")
+    assert not leaked, f"Should not contain HTML comments or XML declaration: {leaked}"
+    leaked = forbidden_tokens(content, "ocr_", "bbox")
+    assert not leaked, f"Content should not contain HOCR class names or bounding box info: {leaked}"
 
-    result = convert(hocr_content)
+    missing = {token for token in MULTILINGUAL_TOKENS if token not in result}
+    assert not missing, f"Should preserve multilingual text, punctuation, numbers and emails: {missing}"
 
-    assert "fööbär" in result, "Should preserve UTF-8 special characters"
 
-
-def test_overlapping_bbox_hocr() -> None:
-    hocr_content = (TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / "bbox_overlapping.hocr").read_text(
-        encoding="utf-8"
-    )
+def test_utf8_encoding_hocr(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["comprehensive/utf8_encoding.hocr"]
 
     result = convert(hocr_content)
-    content = get_content_without_frontmatter(result)
 
-    assert isinstance(result, str), "Should return string"
-    assert "bbox" not in content, "Content should not contain bounding box information"
-    assert "<!--" not in result, "Should not contain HTML comments"
+    assert "fööbär" in result, "Should preserve UTF-8 special characters"
 
 
-@pytest.mark.parametrize(
-    "comprehensive_file",
-    [
-        "valid_file.hocr",
-        "with_body_tag.hocr",
-        "utf8_encoding.hocr",
-        "word_confidence.hocr",
-        "bbox_overlapping.hocr",
-    ],
-)
-def test_comprehensive_hocr_files(comprehensive_file: str) -> None:
-    hocr_path = TEST_DOCUMENTS_DIR / "test_data" / "hocr" / "comprehensive" / comprehensive_file
-    hocr_content = hocr_path.read_text(encoding="utf-8")
+def test_overlapping_bbox_hocr(hocr_corpus: dict[str, str]) -> None:
+    hocr_content = hocr_corpus["comprehensive/bbox_overlapping.hocr"]
 
     result = convert(hocr_content)
     content = get_content_without_frontmatter(result)
 
     assert isinstance(result, str), "Should return string"
-    assert "<?xml" not in result, "Should not contain XML declaration"
-    assert "<!DOCTYPE" not in result, "Should not contain DOCTYPE"
-    assert "<html" not in result, "Should not contain HTML tags"
-
     assert "bbox" not in content, "Content should not contain bounding box information"
-    assert "x_wconf" not in content, "Content should not contain confidence scores"
-    assert "baseline" not in content, "Content should not contain baseline information"
-    assert "ppageno" not in content, "Content should not contain page number information"
+    assert "<!--" not in result, "Should not contain HTML comments"
 
 
 def test_hocr_table_extraction() -> None:
-    hocr_content = """
-    <html>
-    <body>
-        <div class="ocr_page">
-            <div class="ocr_table">
-                <span class="ocrx_word" title="bbox 100 50 140 70; x_wconf 95">Product</span>
-                <span class="ocrx_word" title="bbox 200 50 240 70; x_wconf 95">Price</span>
-                <span class="ocrx_word" title="bbox 300 50 340 70; x_wconf 95">Stock</span>
-                <span class="ocrx_word" title="bbox 100 100 140 120; x_wconf 95">Apple</span>
-                <span class="ocrx_word" title="bbox 200 100 240 120; x_wconf 95">$1.50</span>
-                <span class="ocrx_word" title="bbox 300 100 340 120; x_wconf 95">Yes</span>
-                <span class="ocrx_word" title="bbox 100 150 140 170; x_wconf 95">Orange</span>
-                <span class="ocrx_word" title="bbox 200 150 240 170; x_wconf 95">$2.00</span>
-                <span class="ocrx_word" title="bbox 300 150 340 170; x_wconf 95">No</span>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    result = convert(hocr_content)
+    result = convert(TABLE_HOCR)
 
     assert "|" in result, "Should contain table markdown"
     assert "Product" in result, "Should contain header"
@@ -352,20 +370,7 @@ def test_hocr_table_extraction() -> None:
 
 
 def test_hocr_without_table_element() -> None:
-    hocr_content = """
-    <html>
-    <body>
-        <div class="ocr_page">
-            <span class="ocrx_word" title="bbox 100 50 140 70; x_wconf 95">Col1</span>
-            <span class="ocrx_word" title="bbox 200 50 240 70; x_wconf 95">Col2</span>
-            <span class="ocrx_word" title="bbox 100 100 140 120; x_wconf 95">Data1</span>
-            <span class="ocrx_word" title="bbox 200 100 240 120; x_wconf 95">Data2</span>
-        </div>
-    </body>
-    </html>
-    """
-
-    result = convert(hocr_content)
+    result = convert(UNMARKED_TABLE_HOCR)
 
     assert "Col1" in result
     assert "Col2" in result
@@ -375,19 +380,7 @@ def test_hocr_without_table_element() -> None:
 
 
 def test_hocr_word_extraction() -> None:
-    hocr_content = """
-    <html>
-    <body>
-        <div class="ocr_page">
-            <span class="ocrx_word" title="bbox 100 50 140 70; x_wconf 95">Good</span>
-            <span class="ocrx_word" title="bbox 200 50 240 70; x_wconf 30">Bad</span>
-            <span class="ocrx_word" title="bbox 100 100 140 120; x_wconf 92">Quality</span>
-        </div>
-    </body>
-    </html>
-    """
-
-    result = convert(hocr_content)
+    result = convert(WORD_CONFIDENCE_HOCR)
 
     assert "Good" in result, "High confidence word should be included"
     assert "Bad" in result, "Low confidence word should also be included"
@@ -7,6 +7,17 @@ from html_to_markdown import (
     convert_with_inline_images,
 )
 
+SAMPLE_INLINE_IMAGE: InlineImage = {
+    "data": b"binary",
+    "format": "png",
+    "filename": None,
+    "description": None,
+    "dimensions": None,
+    "source": "img_data_uri",
+    "attributes": {},
+}
+SAMPLE_INLINE_IMAGE_WARNING: InlineImageWarning = {"index": 0, "message": "test"}
+
 
 def test_convert_with_inline_images_extracts_data_uri() -> None:
     html = '<img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/x8AAusB9Y9GeVwAAAAASUVORK5CYII=" alt="Pixel">'
@@ -27,17 +38,5 @@ def test_convert_with_inline_images_extracts_data_uri() -> None:
 
 
 def test_inline_image_typeddicts_are_exposed() -> None:
-    image: InlineImage = {
-        "data": b"binary",
-        "format": "png",
-        "filename": None,
-        "description": None,
-        "dimensions": None,
-        "source": "img_data_uri",
-        "attributes": {},
-    }
-
-    warning: InlineImageWarning = {"index": 0, "message": "test"}
-
-    assert image["format"] == "png"
-    assert warning["index"] == 0
+    assert SAMPLE_INLINE_IMAGE["format"] == "png"
+    assert SAMPLE_INLINE_IMAGE_WARNING["index"] == 0
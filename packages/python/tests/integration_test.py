@@ -192,68 +192,59 @@ def test_li_text(convert: Callable[..., str]) -> None:
     )
 
 
-def test_table(
-    table: str,
-    table_with_html_content: str,
-    table_with_paragraphs: str,
-    table_with_linebreaks: str,
-    table_with_header_column: str,
-    table_head_body: str,
-    table_head_body_missing_head: str,
-    table_missing_text: str,
-    table_missing_head: str,
-    table_body: str,
-    table_with_caption: str,
-    table_with_colspan: str,
-    table_with_undefined_colspan: str,
-    convert: Callable[..., str],
-) -> None:
-    assert (
-        convert(table)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_with_html_content)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| **Jill** | *Smith* | [50](#) |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_with_paragraphs)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_with_linebreaks)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith  Jackson | 50 |\n| Eve | Jackson  Smith | 94 |\n"
-    )
-    assert (
-        convert(table_with_header_column)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_head_body)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_head_body_missing_head)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_missing_text)
-        == "\n\n|  | Lastname | Age |\n| --- | --- | --- |\n| Jill |  | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_missing_head)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert (
-        convert(table_body)
-        == "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert convert(table_with_caption) == "TEXT\n\n*Caption*\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n"
-    assert (
-        convert(table_with_colspan)
-        == "\n\n| Name | | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n"
-    )
-    assert convert(table_with_undefined_colspan) == "\n\n| Name | Age |\n| --- | --- |\n| Jill | Smith |\n"
+@pytest.mark.parametrize(
+    "fixture_name,expected",
+    [
+        (
+            "table",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_with_html_content",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| **Jill** | *Smith* | [50](#) |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_with_paragraphs",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_with_linebreaks",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith  Jackson | 50 |\n| Eve | Jackson  Smith | 94 |\n",
+        ),
+        (
+            "table_with_header_column",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_head_body",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_head_body_missing_head",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_missing_text",
+            "\n\n|  | Lastname | Age |\n| --- | --- | --- |\n| Jill |  | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_missing_head",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        (
+            "table_body",
+            "\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        ("table_with_caption", "TEXT\n\n*Caption*\n\n| Firstname | Lastname | Age |\n| --- | --- | --- |\n"),
+        (
+            "table_with_colspan",
+            "\n\n| Name | | Age |\n| --- | --- | --- |\n| Jill | Smith | 50 |\n| Eve | Jackson | 94 |\n",
+        ),
+        ("table_with_undefined_colspan", "\n\n| Name | Age |\n| --- | --- |\n| Jill | Smith |\n"),
+    ],
+)
+def test_table(fixture_name: str, expected: str, request: pytest.FixtureRequest, convert: Callable[..., str]) -> None:
+    assert convert(request.getfixturevalue(fixture_name)) == expected
 
 
 def inline_tests(tag: str, markup: str, convert: Callable[..., str]) -> None:
@@ -385,25 +376,34 @@ def test_caption(convert: Callable[..., str]) -> None:
 
 def test_code(convert: Callable[..., str]) -> None:
     inline_tests("code", "`", convert)
-    assert convert("<code>*this_should_not_escape*</code>") == "`*this_should_not_escape*`\n"
-    assert convert("<kbd>*this_should_not_escape*</kbd>") == "`*this_should_not_escape*`\n"
-    assert convert("<samp>*this_should_not_escape*</samp>") == "`*this_should_not_escape*`\n"
-    assert convert("<code><span>*this_should_not_escape*</span></code>") == "`*this_should_not_escape*`\n"
     assert convert("<div><code>code_with_underscores</code></div>", preprocess=True) == "`code_with_underscores`\n"
-    assert convert("<span><code>*asterisks* and _underscores_</code></span>") == "`*asterisks* and _underscores_`\n"
     assert convert("<p><code>foo_bar_baz</code></p>", preprocess=True) == "`foo_bar_baz`\n"
-    assert convert("<code>this  should\t\tnormalize</code>") == "`this  should\t\tnormalize`\n"
-    assert convert("<code><span>this  should\t\tnormalize</span></code>") == "`this  should\t\tnormalize`\n"
-    assert convert("<code>foo<b>bar</b>baz</code>") == "`foobarbaz`\n"
-    assert convert("<kbd>foo<i>bar</i>baz</kbd>") == "`foobarbaz`\n"
-    assert convert("<samp>foo<del> bar </del>baz</samp>") == "`foo bar baz`\n"
-    assert convert("<samp>foo <del>bar</del> baz</samp>") == "`foo bar baz`\n"
-    assert convert("<code>foo<em> bar </em>baz</code>") == "`foo bar baz`\n"
-    assert convert("<code>foo<code> bar </code>baz</code>") == "`foo bar baz`\n"
-    assert convert("<code>foo<strong> bar </strong>baz</code>") == "`foo bar baz`\n"
-    assert convert("<code>foo<s> bar </s>baz</code>") == "`foo bar baz`\n"
-    assert convert("<code>foo<sup>bar</sup>baz</code>") == "`foobarbaz`\n"
-    assert convert("<code>foo<sub>bar</sub>baz</code>") == "`foobarbaz`\n"
+
+
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<code>*this_should_not_escape*</code>", "`*this_should_not_escape*`\n"),
+        ("<kbd>*this_should_not_escape*</kbd>", "`*this_should_not_escape*`\n"),
+        ("<samp>*this_should_not_escape*</samp>", "`*this_should_not_escape*`\n"),
+        ("<code><span>*this_should_not_escape*</span></code>", "`*this_should_not_escape*`\n"),
+        ("<span><code>*asterisks* and _underscores_</code></span>", "`*asterisks* and _underscores_`\n"),
+        ("<code>this  should\t\tnormalize</code>", "`this  should\t\tnormalize`\n"),
+        ("<code><span>this  should\t\tnormalize</span></code>", "`this  should\t\tnormalize`\n"),
+        ("<code>foo<b>bar</b>baz</code>", "`foobarbaz`\n"),
+        ("<kbd>foo<i>bar</i>baz</kbd>", "`foobarbaz`\n"),
+        ("<samp>foo<del> bar </del>baz</samp>", "`foo bar baz`\n"),
+        ("<samp>foo <del>bar</del> baz</samp>", "`foo bar baz`\n"),
+        ("<code>foo<em> bar </em>baz</code>", "`foo bar baz`\n"),
+        ("<code>foo<code> bar </code>baz</code>", "`foo bar baz`\n"),
+        ("<code>foo<strong> bar </strong>baz</code>", "`foo bar baz`\n"),
+        ("<code>foo<s> bar </s>baz</code>", "`foo bar baz`\n"),
+        ("<code>foo<sup>bar</sup>baz</code>", "`foobarbaz`\n"),
+        ("<code>foo<sub>bar</sub>baz</code>", "`foobarbaz`\n"),
+    ],
+)
+def test_code_elements(html: str, expected: str, convert: Callable[..., str]) -> None:
+    assert convert(html) == expected
 
 
 def test_del(convert: Callable[..., str]) -> None:
@@ -468,8 +468,9 @@ def test_hn_eol(convert: Callable[..., str]) -> None:
     assert convert("xxx<h3>Hello</h3>", heading_style="atx") == "xxx\n\n### Hello\n"
 
 
-def test_hn_nested_simple_tag(convert: Callable[..., str]) -> None:
-    inline_tag_to_markdown = [
+@pytest.mark.parametrize(
+    "tag,markdown",
+    [
         ("strong", "**strong**"),
         ("b", "**b**"),
         ("em", "*em*"),
@@ -477,11 +478,13 @@ def test_hn_nested_simple_tag(convert: Callable[..., str]) -> None:
         ("a", "a"),
         ("div", "div"),
         ("blockquote", "blockquote"),
-    ]
+    ],
+)
+def test_hn_nested_simple_tag(tag: str, markdown: str, convert: Callable[..., str]) -> None:
+    assert convert(f"<h3>A <{tag}>{tag}</{tag}> B</h3>") == f"### A {markdown} B\n"
 
-    for tag, markdown in inline_tag_to_markdown:
-        assert convert("<h3>A <" + tag + ">" + tag + "</" + tag + "> B</h3>") == "### A " + markdown + " B\n"
 
+def test_hn_nested_block_tag(convert: Callable[..., str]) -> None:
     result = convert("<h3>A <p>p</p> B</h3>")
     assert result in ["### A p B\n", "### A\n\np\n\n B"]
 
@@ -637,31 +640,39 @@ def test_mark_tag_with_complex_content(convert: Callable[..., str]) -> None:
     assert "==highlighted item text==" in result
 
 
-def test_pre(convert: Callable[..., str]) -> None:
-    assert convert("<pre>test\n    foo\nbar</pre>") == "```\ntest\n    foo\nbar\n```\n"
-    assert convert("<pre><code>test\n    foo\nbar</code></pre>") == "```\ntest\n    foo\nbar\n```\n"
-    assert convert("<pre>*this_should_not_escape*</pre>") == "```\n*this_should_not_escape*\n```\n"
-    assert convert("<pre><span>*this_should_not_escape*</span></pre>") == "```\n*this_should_not_escape*\n```\n"
-    assert convert("<div><pre>code_with_underscores</pre></div>") == "```\ncode_with_underscores\n```\n"
-    assert convert("<div><pre>*asterisks* and _underscores_</pre></div>") == "```\n*asterisks* and _underscores_\n```\n"
-    assert convert("<section><pre>foo_bar_baz</pre></section>") == "```\nfoo_bar_baz\n```\n"
-    assert convert("<pre>\t\tthis  should\t\tnot  normalize</pre>") == "```\n\t\tthis  should\t\tnot  normalize\n```\n"
-    assert (
-        convert("<pre><span>\t\tthis  should\t\tnot  normalize</span></pre>")
-        == "```\n\t\tthis  should\t\tnot  normalize\n```\n"
-    )
-    assert convert("<pre>foo<b>\nbar\n</b>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo<i>\nbar\n</i>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo\n<i>bar</i>\nbaz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo<i>\n</i>baz</pre>") == "```\nfoo\nbaz\n```\n"
-    assert convert("<pre>foo<del>\nbar\n</del>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo<em>\nbar\n</em>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo<code>\nbar\n</code>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo<strong>\nbar\n</strong>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
-    assert convert("<pre>foo<s>\nbar\n</s>baz</pre>") == "```\nfoo\nbar\nbaz\n```\n"
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("<pre>test\n    foo\nbar</pre>", "```\ntest\n    foo\nbar\n```\n"),
+        ("<pre><code>test\n    foo\nbar</code></pre>", "```\ntest\n    foo\nbar\n```\n"),
+        ("<pre>*this_should_not_escape*</pre>", "```\n*this_should_not_escape*\n```\n"),
+        ("<pre><span>*this_should_not_escape*</span></pre>", "```\n*this_should_not_escape*\n```\n"),
+        ("<div><pre>code_with_underscores</pre></div>", "```\ncode_with_underscores\n```\n"),
+        ("<div><pre>*asterisks* and _underscores_</pre></div>", "```\n*asterisks* and _underscores_\n```\n"),
+        ("<section><pre>foo_bar_baz</pre></section>", "```\nfoo_bar_baz\n```\n"),
+        ("<pre>\t\tthis  should\t\tnot  normalize</pre>", "```\n\t\tthis  should\t\tnot  normalize\n```\n"),
+        (
+            "<pre><span>\t\tthis  should\t\tnot  normalize</span></pre>",
+            "```\n\t\tthis  should\t\tnot  normalize\n```\n",
+        ),
+        ("<pre>foo<b>\nbar\n</b>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo<i>\nbar\n</i>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo\n<i>bar</i>\nbaz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo<i>\n</i>baz</pre>", "```\nfoo\nbaz\n```\n"),
+        ("<pre>foo<del>\nbar\n</del>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo<em>\nbar\n</em>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo<code>\nbar\n</code>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo<strong>\nbar\n</strong>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+        ("<pre>foo<s>\nbar\n</s>baz</pre>", "```\nfoo\nbar\nbaz\n```\n"),
+    ],
+)
+def test_pre(html: str, expected: str, convert: Callable[..., str]) -> None:
+    assert convert(html) == expected
+
+
+def test_pre_with_options(convert: Callable[..., str]) -> None:
     assert convert("<pre>foo<sup>\nbar\n</sup>baz</pre>", sup_symbol="^") == "```\nfoo\nbar\nbaz\n```\n"
     assert convert("<pre>foo<sub>\nbar\n</sub>baz</pre>", sub_symbol="^") == "```\nfoo\nbar\nbaz\n```\n"
-
     assert convert("<pre>test\n    foo\nbar</pre>", code_block_style="indented") == "    test\n        foo\n    bar\n"
     assert (
         convert("<pre><code>test\n    foo\nbar</code></pre>", code_block_style="indented")
@@ -7,6 +7,7 @@ import time
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 
 import pytest
@@ -15,14 +16,6 @@ from html_to_markdown import convert_to_markdown
 
 pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
 
-try:
-    import psutil
-
-    MEMORY_AVAILABLE = True
-except ImportError:
-    MEMORY_AVAILABLE = False
-
-
 try:
     import cProfile
     import pstats
@@ -57,7 +50,9 @@ class PerformanceMetrics:
 
 @contextmanager
 def memory_monitor() -> Generator[dict[str, float], None, None]:
-    if not MEMORY_AVAILABLE:
+    try:
+        import psutil  # noqa: PLC0415
+    except ImportError:
         yield {"before": 0.0, "after": 0.0, "peak": 0.0}
         return
 
@@ -86,71 +81,74 @@ def memory_monitor() -> Generator[dict[str, float], None, None]:
         metrics.update({"after": memory_after, "peak": peak_memory})
 
 
+_SECTION_LINES = (
+    "<article id='section-{i}'>",
+    "  <header><h1>Section {i}: Complex Content</h1></header>",
+    "  <p>This is paragraph {i} with <strong>bold</strong>, <em>italic</em>, ",
+    "  <code>inline code</code>, and <mark>highlighted</mark> text.</p>",
+    "  <section>",
+    "    <h2>Subsection with Lists</h2>",
+    "    <ul>",
+    "      <li>First item with <a href='https://example.com'>external link</a></li>",
+    "      <li>Second item with <kbd>Ctrl+C</kbd> keyboard shortcut</li>",
+    "      <li>Third item with <time datetime='2023-01-01'>timestamp</time></li>",
+    "      <li><input type='checkbox' checked> Completed task</li>",
+    "      <li><input type='checkbox'> Pending task</li>",
+    "    </ul>",
+    "    <ol>",
+    "      <li>Numbered item with <abbr title='HyperText Markup Language'>HTML</abbr></li>",
+    "      <li>Another item with <sub>subscript</sub> and <sup>superscript</sup></li>",
+    "    </ol>",
+    "  </section>",
+    "  <blockquote cite='https://example.com/quote'>",
+    "    <p>This is a quote in section {i} with <cite>proper citation</cite>.</p>",
+    "  </blockquote>",
+    "  <figure>",
+    "    <table>",
+    "      <caption>Data Table for Section {i}</caption>",
+    "      <thead>",
+    "        <tr><th>Column 1</th><th>Column 2</th><th>Column 3</th></tr>",
+    "      </thead>",
+    "      <tbody>",
+    "        <tr><td>Data {i}-1</td><td>Value {i}-A</td><td><progress value='75' max='100'>75%</progress></td></tr>",
+    "        <tr><td>Data {i}-2</td><td>Value {i}-B</td><td><meter value='0.8' min='0' max='1'>80%</meter></td></tr>",
+    "      </tbody>",
+    "    </table>",
+    "    <figcaption>Performance data visualization</figcaption>",
+    "  </figure>",
+    "  <details>",
+    "    <summary>Collapsible Content</summary>",
+    "    <p>This content is initially hidden and contains <del>deleted</del> and <ins>inserted</ins> text.</p>",
+    "    <pre><code class='language-python'>",
+    "def example_function():",
+    "    return 'Hello, World!'",
+    "</code></pre>",
+    "  </details>",
+    "  <aside>",
+    "    <p><small>Note: This is supplementary information for section {i}.</small></p>",
+    "  </aside>",
+    "</article>",
+)
+_SECTION_TEMPLATE = "\n".join(_SECTION_LINES)
+
+
+@cache
 def generate_complex_html(size_factor: int = 100) -> str:
-    html_parts = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        "  <title>Performance Test Document</title>",
-        "  <meta name='description' content='A complex HTML document for performance testing'>",
-        "  <meta name='keywords' content='html, markdown, performance, test'>",
-        "</head>",
-        "<body>",
-    ]
-
-    for i in range(size_factor):
-        section_html = [
-            f"<article id='section-{i}'>",
-            f"  <header><h1>Section {i}: Complex Content</h1></header>",
-            f"  <p>This is paragraph {i} with <strong>bold</strong>, <em>italic</em>, ",
-            "  <code>inline code</code>, and <mark>highlighted</mark> text.</p>",
-            "  <section>",
-            "    <h2>Subsection with Lists</h2>",
-            "    <ul>",
-            "      <li>First item with <a href='https://example.com'>external link</a></li>",
-            "      <li>Second item with <kbd>Ctrl+C</kbd> keyboard shortcut</li>",
-            "      <li>Third item with <time datetime='2023-01-01'>timestamp</time></li>",
-            "      <li><input type='checkbox' checked> Completed task</li>",
-            "      <li><input type='checkbox'> Pending task</li>",
-            "    </ul>",
-            "    <ol>",
-            "      <li>Numbered item with <abbr title='HyperText Markup Language'>HTML</abbr></li>",
-            "      <li>Another item with <sub>subscript</sub> and <sup>superscript</sup></li>",
-            "    </ol>",
-            "  </section>",
-            "  <blockquote cite='https://example.com/quote'>",
-            f"    <p>This is a quote in section {i} with <cite>proper citation</cite>.</p>",
-            "  </blockquote>",
-            "  <figure>",
-            "    <table>",
-            "      <caption>Data Table for Section " + str(i) + "</caption>",
-            "      <thead>",
-            "        <tr><th>Column 1</th><th>Column 2</th><th>Column 3</th></tr>",
-            "      </thead>",
-            "      <tbody>",
-            f"        <tr><td>Data {i}-1</td><td>Value {i}-A</td><td><progress value='75' max='100'>75%</progress></td></tr>",
-            f"        <tr><td>Data {i}-2</td><td>Value {i}-B</td><td><meter value='0.8' min='0' max='1'>80%</meter></td></tr>",
-            "      </tbody>",
-            "    </table>",
-            "    <figcaption>Performance data visualization</figcaption>",
-            "  </figure>",
-            "  <details>",
-            "    <summary>Collapsible Content</summary>",
-            "    <p>This content is initially hidden and contains <del>deleted</del> and <ins>inserted</ins> text.</p>",
-            "    <pre><code class='language-python'>",
-            "def example_function():",
-            "    return 'Hello, World!'",
-            "</code></pre>",
-            "  </details>",
-            "  <aside>",
-            "    <p><small>Note: This is supplementary information for section " + str(i) + ".</small></p>",
-            "  </aside>",
-            "</article>",
+    return "\n".join(
+        [
+            "<!DOCTYPE html>",
+            "<html>",
+            "<head>",
+            "  <title>Performance Test Document</title>",
+            "  <meta name='description' content='A complex HTML document for performance testing'>",
+            "  <meta name='keywords' content='html, markdown, performance, test'>",
+            "</head>",
+            "<body>",
+            *(_SECTION_TEMPLATE.format(i=i) for i in range(size_factor)),
+            "</body>",
+            "</html>",
         ]
-        html_parts.extend(section_html)
-
-    html_parts.extend(["</body>", "</html>"])
-    return "\n".join(html_parts)
+    )
 
 
 def benchmark_function(
@@ -630,13 +630,7 @@ async def test_async_visitor_many_elements() -> None:
 @pytest.mark.asyncio
 async def test_async_visitor_deeply_nested() -> None:
     """Test async visitor with deeply nested structure."""
-    html = "<div>"
-    for i in range(10):
-        html += f"<div>Level {i}"
-    html += "Content"
-    for _i in range(10):
-        html += "</div>"
-    html += "</div>"
+    html = "<div>" + "".join(f"<div>Level {i}" for i in range(10)) + "Content" + "</div>" * 10 + "</div>"
 
     visitor = AsyncVisitorWithContextInfo()
     result = convert_with_async_visitor(html, visitor=visitor)